@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: 2025 JG for Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+"""
+`camera_base.py`
+Thermal camera base object. Common properties and sensor data normalization
+for the thermal camera objects.
+"""
+
+from ulab import numpy as np
+
+# Interpolation slices; built once rather than on every kernel call
+_EVEN = slice(None, None, 2)
+_ODD = slice(1, None, 2)
+_HEAD = slice(None, -1)
+_TAIL = slice(1, None)
+_EVEN_HEAD = slice(None, -1, 2)
+_EVEN_TAIL = slice(2, None, 2)
+_ALL = slice(None)
+
+
+def _bilinear2x(sensor, grid):
+    """2x bilinear interpolation kernel; upscales the sensor array into the
+    grid array. Even rows copy the sensor values and average horizontal
+    neighbors, then whole odd rows average the even rows above and below;
+    by @v923z and @David.Glaude.
+    :param np.array sensor: The normalized (rows, cols) sensor array. No default.
+    :param np.array grid: The (2 * rows - 1, 2 * cols - 1) grid array. No default."""
+    grid[_EVEN, _EVEN] = sensor
+    grid[_EVEN, _ODD] = (sensor[_ALL, _HEAD] + sensor[_ALL, _TAIL]) * 0.5
+    grid[_ODD, _ALL] = (grid[_EVEN_HEAD, _ALL] + grid[_EVEN_TAIL, _ALL]) * 0.5
+
+
+class CameraBase:
+    def __init__(self, temp_range_c, auto_focus, sensor_axis, interpolate=False):
+        """Initialize the CameraBase object.
+        :param tuple temp_range_c: The camera's temperature range in Celsius.
+          No default.
+        :param bool auto_focus: The autofocus enable state. No default.
+        :param list sensor_axis: The size of the sensor element array axis.
+          No default.
+        :param bool interpolate: Enable linear interpolation. Defaults to False."""
+        self._range_min_c = temp_range_c[0]
+        self._range_max_c = temp_range_c[1]
+        self._auto_focus = auto_focus
+        self._interpolate = interpolate
+
+        self._sensor_axis = sensor_axis
+        if self._interpolate:
+            self._grid_axis = [
+                (2 * self._sensor_axis[0]) - 1,
+                (2 * self._sensor_axis[1]) - 1,
+            ]
+        else:
+            self._grid_axis = self._sensor_axis
+
+        # Set up the 2-D sensor data narray; filled by the first acquisition
+        self._sensor_data = np.zeros(
+            (self._sensor_axis[0], self._sensor_axis[1]), dtype=np.float
+        )
+        self._last_frame = self._sensor_data  # The latest _finalize result
+
+        # Normalization scale for the fixed temperature range; averaging scale
+        self._inv_full_range = 1 / (self._range_max_c - self._range_min_c)
+        self._inv_sensor_cells = 1 / (self._sensor_axis[0] * self._sensor_axis[1])
+
+        self._sensor_min_c = 0
+        self._sensor_avg_c = 0
+        self._sensor_max_c = 0
+
+    @property
+    def autofocus(self):
+        """The autofocus mode."""
+        return self._auto_focus
+
+    @autofocus.setter
+    def autofocus(self, new_focus):
+        """Enable or disable the autofocus mode.
+        :param bool new_focus: The autofocus enable state. No default."""
+        self._auto_focus = new_focus
+
+    @property
+    def statistics(self):
+        """Calculate the minimum, average, and maximum sensor
+        values of the latest camera acquisition."""
+        return self._sensor_min_c, self._sensor_avg_c, self._sensor_max_c
+
+    @property
+    def sensor_axis(self):
+        """The sensor axis sizes. Returns a tuple of the x-axis and
+        y-axis sizes."""
+        return self._sensor_axis
+
+    @property
+    def grid_axis(self):
+        """Resultant grid axis sizes. Returns a tuple of the x-axis and
+        y-axis sizes."""
+        return self._grid_axis
+
+    @property
+    def grid_data(self):
+        """A two-dimensional np.array containing grid data. Values are
+        normalized floating point color indices, 0.0 to 1.0."""
+        return self._grid_data
+
+    def _finalize(self, sensor_data):
+        """Calculate statistics, normalize, and interpolate the sensor data.
+        Returns an array of interpolated and normalized grid values.
+        :param np.array sensor_data: The sensor data array, limited to the sensor's
+          range. Normalized in place. No default."""
+        self._sensor_data = sensor_data
+
+        # Calculate statistics; locals avoid repeated attribute lookups
+        min_c = np.min(sensor_data)
+        max_c = np.max(sensor_data)
+        self._sensor_min_c = min_c
+        self._sensor_avg_c = np.sum(sensor_data) * self._inv_sensor_cells
+        self._sensor_max_c = max_c
+
+        # Autofocus normalization; in place to avoid temporary arrays
+        if self._auto_focus:
+            # A uniform frame has no span to scale; it stays zero-filled
+            sensor_data -= min_c
+            if max_c > min_c:
+                sensor_data *= 1 / (max_c - min_c)
+        else:
+            sensor_data -= self._range_min_c
+            sensor_data *= self._inv_full_range
+
+        # Interpolate the sensor data; place in the grid data array
+        if self._interpolate:
+            self._ulab_bilinear_interpolation()
+            self._last_frame = self._grid_data
+        else:
+            self._last_frame = self._sensor_data
+        return self._last_frame
+
+    def _ulab_bilinear_interpolation(self):
+        """2x bilinear interpolation to upscale the sensor data array; by @v923z
+        and @David.Glaude."""
+        _bilinear2x(self._sensor_data, self._grid_data)
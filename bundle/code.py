@@ -10,7 +10,6 @@ import time
 import os
 import gc
 import board
-import struct
 import rtc
 import ssl
 import supervisor
@@ -22,7 +21,6 @@ import neopixel
 from analogio import AnalogIn
 from digitalio import DigitalInOut, Direction
 import adafruit_binascii as binascii
-from simpleio import map_range
 
 from wtc_display import Display, WeekDayMonth, Colors
 from camera_amg88xx import CameraAMG88xx
@@ -30,7 +28,7 @@ from camera_amg88xx import CameraAMG88xx
 
 def celsius_to_fahrenheit(deg_c=None):
     """Convert C to F; round to 1 degree C"""
-    return round(((9 / 5) * deg_c) + 32)
+    return round((deg_c * 1.8) + 32)
 
 
 def fahrenheit_to_celsius(deg_f=None):
@@ -84,8 +82,8 @@ display = Display(
     cell_outline=CELL_OUTLINE,
 )
 display.brightness = BRIGHTNESS
+display.alarm_value.text = str(ALARM_F)  # Display the alarm setting
 display.update_image_frame(camera.grid_data)  # Display the sample spectrum
-display.alert("IRON")
 
 # Instantiate the red LED
 led = DigitalInOut(board.LED)
@@ -99,14 +97,29 @@ pixels.brightness = BRIGHTNESS
 
 # Instantiate the ALS-PT19 light sensor for auto display brightness
 light_sensor = AnalogIn(board.A3)
+# Raw light sensor value to lux; full-scale (65535) is approximately 1500 lux
+ALS_LUX_SCALE = 1500 / 65535
+# Ambient light (5 to 200 lux) to display brightness (0.3 to BRIGHTNESS) slope
+ALS_SLOPE = (BRIGHTNESS - 0.3) / (200 - 5)
+ALS_MIN_BRIGHTNESS = min(0.3, BRIGHTNESS)
+ALS_MAX_BRIGHTNESS = max(0.3, BRIGHTNESS)
 
 
 def _send_b64_to_aio(data):
     """Convert byte array to base64 and send to AIO feed.
     :param bytearray data: The byte array to be sent. No default."""
     pixels[0] = FETCH
-    # Strip off newline character and encode
-    b64_data = binascii.b2a_base64(data).strip().decode("utf-8")
+    # Encode in 57-byte blocks (76 base64 characters) into a preallocated
+    #   buffer, then decode once as ASCII for the AIO JSON payload
+    b64_data = bytearray(((len(data) + 2) // 3) * 4)
+    data = memoryview(data)
+    b64_index = 0
+    for i in range(0, len(data), 57):
+        block = binascii.b2a_base64(data[i : i + 57])
+        block_length = len(block) - 1  # Strip off newline character
+        b64_data[b64_index : b64_index + block_length] = block[:block_length]
+        b64_index += block_length
+    b64_data = b64_data.decode("ascii")
     try:
         while io.get_remaining_throttle_limit() <= 10:
             busy(1)  # Wait until throttle limit increases
@@ -127,7 +140,6 @@ def acquire_and_display():
     # Update and display alarm setting and max, min, and ave stats
     time_to_display = time.monotonic()  # Time marker: Display Image
     t_min, t_avg, t_max = camera.statistics
-    display.alarm_value.text = str(ALARM_F)
     display.max_value.text = str(celsius_to_fahrenheit(t_max))
     display.min_value.text = str(celsius_to_fahrenheit(t_min))
     display.avg_value.text = str(celsius_to_fahrenheit(t_avg))
@@ -145,15 +157,16 @@ def adjust_brightness():
     brightness based on ambient light. The display brightness ranges from 0.05
     to BRIGHTNESS when the ambient light level falls between 5 and 200 lux.
     Full-scale raw light sensor value (65535) is approximately 1500 Lux."""
-    global old_brightness
+    global old_brightness, als_average
     if not AUTO_BRIGHTNESS:
         return
-    raw = 0
-    for i in range(20):
-        raw = raw + light_sensor.value
+    # Exponential moving average of one light sensor reading per frame (1/16)
+    als_average = ((als_average * 15) + light_sensor.value) >> 4
 
+    lux = als_average * ALS_LUX_SCALE
+    target_brightness = 0.3 + ((lux - 5) * ALS_SLOPE)
     target_brightness = round(
-        map_range(raw / 20 / 65535 * 1500, 5, 200, 0.3, BRIGHTNESS), 3
+        min(max(target_brightness, ALS_MIN_BRIGHTNESS), ALS_MAX_BRIGHTNESS), 3
     )
     new_brightness = round(
         old_brightness + ((target_brightness - old_brightness) / 5), 3
@@ -183,32 +196,23 @@ def capture_grid_and_upload():
     print("Creating Bitmap Image...")
     width = display.grid_axis[0]
     height = display.grid_axis[1]
-    file_size = 54 + height * display.bytes_per_row(width)
-    # Build the Bitmap BMP Header
-    bmp_header = (
-        bytes("BM", "ascii")
-        + struct.pack("<I", file_size)
-        + b"\00\x00"
-        + b"\00\x00"
-        + struct.pack("<I", 54)
-    )
-    # Build the Bitmap DIB Header
-    dib_header = (
-        struct.pack("<I", 40)
-        + struct.pack("<I", width)
-        + struct.pack("<I", height)
-        + struct.pack("<H", 1)
-        + struct.pack("<H", 24)
-    )
-    for _ in range(24):
-        dib_header += b"\x00"
-    # Build the Grid Image Data
-    grid_bmp_data = b""  # Create blank byte array
-    for _row in range(height - 1, -1, -1):
-        _row_colors = display.fetch_grid_row_bgr_colors(_row, selfie=SELFIE & DISPLAY_IMAGE)
-        grid_bmp_data += _row_colors
+    bytes_per_row = display.bytes_per_row(width)
+    bmp_data = bytearray(display.bmp_file_size)  # Preallocate the bitmap image
+    bmp_data[0:54] = display.bmp_header  # Copy the precomputed BMP + DIB headers
+    # Build the Grid Image Data in place; bitmap rows are stored bottom-up
+    bmp_view = memoryview(bmp_data)
+    for _row in range(height):
+        display.fetch_grid_row_bgr_colors(
+            _row,
+            bmp_view,
+            54 + (height - 1 - _row) * bytes_per_row,
+            selfie=SELFIE & DISPLAY_IMAGE,
+        )
     # Convert to base 64 and send to AIO
-    _send_b64_to_aio(bmp_header + dib_header + grid_bmp_data)
+    _send_b64_to_aio(bmp_data)
+    bmp_data = None
+    bmp_view = None
+    gc.collect()  # Release the image and base 64 buffers
     print("... Done.")
     pixels[0] = NORMAL
     time_to_capture = time.monotonic() - time_to_capture
@@ -229,10 +233,25 @@ def soft_reset(error="", desc="", delay=30):
     supervisor.reload()  # soft reset: keeps the terminal session alive
 
 
-def update_local_time(update=False):
+def handle_minute_events(minute):
+    """Run the scheduled tasks for a new minute. Updates local time from the
+    Internet hourly and uploads a static image every IMAGE_UPLOAD_PERIOD minutes.
+    :param int minute: The current minute. No default."""
+    if minute == LOCAL_TIME_UPDATE:
+        update_local_time(update=True)
+        print("Local Time Updated")
+    if minute % IMAGE_UPLOAD_PERIOD == 0:
+        capture_grid_and_upload()
+        print("Image Uploaded to AIO")
+
+
+def update_local_time(update=False, now=None):
     """Refresh the local clock information. Update from AIO is optional.
     :param bool update: Fetch fresh clock information from AIO.
-    Defaults to False."""
+    Defaults to False.
+    :param time.struct_time now: The current local time. Defaults to None
+    (read the local clock)."""
+    global date_key, date_suffix
     if update:
         pixels[0] = FETCH
         try:
@@ -241,15 +260,17 @@ def update_local_time(update=False):
             )
         except Exception as time_error:
             soft_reset(error=time_error, desc="Update Local Time")
-    local_time = f"{time.localtime().tm_hour:2d}:{time.localtime().tm_min:02d}"
-    wday = time.localtime().tm_wday
-    month = time.localtime().tm_mon
-    day = time.localtime().tm_mday
-    year = time.localtime().tm_year
-    combined = (
-        f"{local_time} {WeekDayMonth.WEEKDAY[wday]}  {WeekDayMonth.MONTH[month - 1]} "
-        + f"{day:02d}, {year:04d}"
-    )
+    if update or now is None:
+        now = time.localtime()
+    # Rebuild the date portion only when the date changes or the clock is set
+    year, month, day = now.tm_year, now.tm_mon, now.tm_mday
+    if update or (year, month, day) != date_key:
+        date_key = (year, month, day)
+        date_suffix = (
+            f"{WeekDayMonth.WEEKDAY[now.tm_wday]}  {WeekDayMonth.MONTH[month - 1]} "
+            + f"{day:02d}, {year:04d}"
+        )
+    combined = f"{now.tm_hour:2d}:{now.tm_min:02d} {date_suffix}"
     if update:
         print(f"Time: {combined}")
     pixels[0] = NORMAL
@@ -259,10 +280,13 @@ def update_local_time(update=False):
 # --- PRIMARY PROCESS SETUP ---
 # Define global variables
 old_brightness = BRIGHTNESS
+als_average = light_sensor.value  # Light sensor moving average
 t_max = 0
 time_to_acquire = 0
 time_to_display = 0
 time_to_capture = 0
+date_key = None  # Year, month, and day of the cached date string
+date_suffix = ""  # Cached weekday, month, day, and year string
 
 # Connect to Wi-Fi
 try:
@@ -293,57 +317,63 @@ except Exception as aio_client_error:
 
 _ = update_local_time(update=True)  # Update local time from Internet
 
-state_LocalTimeUpdated = False  # Reset the local time updated state
-state_ImageUploaded = False  # Reset the image uploaded state
+last_minute = -1  # Last minute that scheduled tasks were checked
 old_t_max = 0  # Create maximum temp history variable; causes image upload
+pending_upload = None  # Alert that is waiting to upload an image
+
+# Run a garbage collection after about a quarter of free memory is allocated
+#   rather than every frame; collect every frame if the threshold is unavailable
+gc.collect()
+gc_threshold = hasattr(gc, "threshold")
+if gc_threshold:
+    gc.threshold(gc.mem_free() // 4)
+
+display.alert("IRON")  # Flashes during the first frames
 
 # --- PRIMARY PROCESS LOOP ---
 while True:
     pixels[0] = NORMAL
     time_to_frame = time.monotonic()
+    now = time.localtime()  # Read the local clock once per frame
+    minute = now.tm_min
     adjust_brightness()
 
     acquire_and_display()  # Get camera data and display image
 
-    # If alarm threshold is reached, upload image and flash NeoPixels
-    if t_max >= ALARM_C:
-        display.alert("ALARM")
-        capture_grid_and_upload()
-        pixels.fill(Colors.RED)
-        pixels.fill(Colors.BLACK)
-
-    # Check for motion and upload if detected
-    if t_max > old_t_max + MOTION_THRESH_C:
-        display.alert("MOTION Detected")
-        time.sleep(0.5)  # Wait for motion to come into frame
-        acquire_and_display()  # Re-acquire camera image
-        capture_grid_and_upload()
+    # If alarm threshold is reached or motion is detected, flash an alert and
+    #   schedule an image upload
+    if pending_upload is None:
+        if t_max >= ALARM_C:
+            display.alert("ALARM")
+            pending_upload = "ALARM"
+        elif t_max > old_t_max + MOTION_THRESH_C:
+            display.alert("MOTION Detected")
+            pending_upload = "MOTION"
     old_t_max = t_max
 
-    # Update local time from the Internet hourly
-    if time.localtime().tm_min == LOCAL_TIME_UPDATE and not state_LocalTimeUpdated:
-        update_local_time()
-        state_LocalTimeUpdated = True
-        print("Local Time Updated")
-    if time.localtime().tm_min == LOCAL_TIME_UPDATE + 1 and state_LocalTimeUpdated:
-        # Reset state_LocalTimeUpdated a minute later
-        state_LocalTimeUpdated = False
+    display.tick_alert()  # Advance the flashing alert message
 
-    # Upload static image every IMAGE_UPLOAD_PERIOD minutes
-    if time.localtime().tm_min % IMAGE_UPLOAD_PERIOD == 0 and not state_ImageUploaded:
+    # Upload the image after the alert finishes flashing; the frames acquired
+    #   meanwhile give motion time to come into frame
+    if pending_upload is not None and not display.alert_active:
         capture_grid_and_upload()
-        state_ImageUploaded = True
-        print("Image Uploaded to AIO")
-    if time.localtime().tm_min % IMAGE_UPLOAD_PERIOD == 1 and state_ImageUploaded:
-        # Reset state_ImageUploaded a minute later
-        state_ImageUploaded = False
-
-    gc.collect()
+        if pending_upload == "ALARM":
+            pixels.fill(Colors.RED)  # Flash NeoPixels
+            pixels.fill(Colors.BLACK)
+        pending_upload = None
+
+    # Run the scheduled hourly and periodic tasks once when the minute changes
+    if minute != last_minute:
+        last_minute = minute
+        handle_minute_events(minute)
+
+    if not gc_threshold:
+        gc.collect()
     time_to_frame = time.monotonic() - time_to_frame
 
     # Print frame performance report
     print("*** Performance Statistics ***")
-    print(f"   {update_local_time()}")
+    print(f"   {update_local_time(now=now)}")
     print(f"  time to capture: {time_to_capture:6.3f} sec")
     print("")
     print("                          rate")
@@ -7,12 +7,14 @@
 
 import time
 import gc
+import math
+import struct
 import board
 import fourwire
 import pwmio
 from ulab import numpy as np
 import displayio
-from simpleio import map_range
+import bitmaptools
 from adafruit_display_text.label import Label
 from adafruit_bitmap_font import bitmap_font
 from adafruit_display_shapes.rect import Rect
@@ -55,6 +57,14 @@ class Colors:
 class Display:
     """A display class for the workshop thermal camera."""
 
+    # Alert message flash phases; (end time in seconds, color)
+    ALERT_PHASES = (
+        (0.1, Colors.RED),
+        (0.2, Colors.YELLOW),
+        (0.3, Colors.RED),
+        (0.8, Colors.YELLOW),
+    )
+
     def __init__(
         self,
         tft="2.4-inch",
@@ -113,22 +123,81 @@ class Display:
         self.image_group = displayio.Group(scale=1)
         self._display.root_group = self.image_group  # Load display
 
-        # Define the foundational thermal image grid cells; image_group[0:224]
-        #   image_group[#] = image_group[ (row * self._grid_axis) + column ]
-        for row in range(self._grid_axis[1]):
-            for col in range(self._grid_axis[0]):
-                cell_x = (col * self._cell_size[0]) + self._grid_offset[0]
-                cell_y = (row * self._cell_size[1]) + self._grid_offset[1]
-                cell = Rect(
-                    x=cell_x,
-                    y=cell_y,
-                    width=self._cell_size[0],
-                    height=self._cell_size[1],
-                    fill=Colors.PURPLE,
-                    outline=Colors.BLACK,
-                    stroke=self._cell_outline,
-                )
-                self.image_group.append(cell)
+        # Define the grid palette; the spectral palette followed by the
+        #   histogram background and column colors
+        self._histo_black = self._palette_size + 1
+        self._histo_base = self._palette_size + 2
+        colors = [
+            index_to_rgb(i / self._palette_size) for i in range(self._palette_size + 1)
+        ]
+        colors.append(Colors.BLACK)
+        colors.extend(
+            index_to_rgb(round((col / self._grid_axis[1]), 3))
+            for col in range(self._grid_axis[0])
+        )
+        self._palette = displayio.Palette(len(colors))
+        for i, color in enumerate(colors):
+            self._palette[i] = color
+
+        # Define the foundational thermal image grid; one bitmap pixel per cell
+        #   scaled to the cell size; image_group[0]
+        #   bitmap[#] = bitmap[ (row * self._grid_axis[0]) + column ]
+        self._bitmap = displayio.Bitmap(
+            self._grid_axis[0], self._grid_axis[1], len(colors)
+        )
+        # Palette index array type; matches the bitmap element size for arrayblit
+        self._index_dtype = np.uint8 if len(colors) <= 256 else np.uint16
+        grid_group = displayio.Group(
+            scale=self._cell_size[0], x=self._grid_offset[0], y=self._grid_offset[1]
+        )
+        grid_group.append(displayio.TileGrid(self._bitmap, pixel_shader=self._palette))
+        self.image_group.append(grid_group)
+
+        # Define the optional grid cell outlines; image_group[1]
+        outline_group = displayio.Group()
+        if self._cell_outline:
+            for row in range(self._grid_axis[1]):
+                for col in range(self._grid_axis[0]):
+                    cell_x = (col * self._cell_size[0]) + self._grid_offset[0]
+                    cell_y = (row * self._cell_size[1]) + self._grid_offset[1]
+                    cell = Rect(
+                        x=cell_x,
+                        y=cell_y,
+                        width=self._cell_size[0],
+                        height=self._cell_size[1],
+                        outline=Colors.BLACK,
+                        stroke=self._cell_outline,
+                    )
+                    outline_group.append(cell)
+        self.image_group.append(outline_group)
+
+        # Bitmap image file size and BMP + DIB headers; fixed by the grid axis
+        self._bmp_file_size = 54 + (
+            self._grid_axis[1] * self.bytes_per_row(self._grid_axis[0])
+        )
+        self._bmp_header = (
+            b"BM"
+            + struct.pack(
+                "<IHHIIIIHH",
+                self._bmp_file_size,
+                0,
+                0,
+                54,
+                40,
+                self._grid_axis[0],
+                self._grid_axis[1],
+                1,
+                24,
+            )
+            + bytes(24)
+        )
+
+        # Bitmap row column addresses; normal and reversed (selfie)
+        self._row_range_fwd = tuple(range(self._grid_axis[0]))
+        self._row_range_rev = tuple(range(self._grid_axis[0] - 1, -1, -1))
+
+        # BGR888 bitmap bytes for each palette index
+        self._bgr_palette = [bytes(self.rgb888_to_bgr888_tuple(rgb)) for rgb in colors]
 
         # Define labels and values
         self.status_label = Label(font_0, text="", color=None)
@@ -137,47 +206,49 @@ class Display:
             (self._grid_size[0] + self._grid_offset[0]) // 2,
             self.height,
         )
-        self.image_group.append(self.status_label)  # image_group[225]
+        self.image_group.append(self.status_label)  # image_group[2]
+        self._alert_start = None  # Start time of the flashing alert message
+        self._alert_color = None
 
         self.alarm_value = Label(font_0, text="---", color=Colors.WHITE)
         self.alarm_value.anchor_point = (1, 0)
         self.alarm_value.anchored_position = (self.width - 5, 5)
-        self.image_group.append(self.alarm_value)  # image_group[226]
+        self.image_group.append(self.alarm_value)  # image_group[3]
 
         self.alarm_label = Label(font_0, text="alarm", color=Colors.WHITE)
         self.alarm_label.anchor_point = (1, 0)
         self.alarm_label.anchored_position = (self.width - 5, 30)
-        self.image_group.append(self.alarm_label)  # image_group[227]
+        self.image_group.append(self.alarm_label)  # image_group[4]
 
         self.max_value = Label(font_0, text="---", color=Colors.RED)
         self.max_value.anchor_point = (1, 0)
         self.max_value.anchored_position = (self.width - 5, 65)
-        self.image_group.append(self.max_value)  # image_group[228]
+        self.image_group.append(self.max_value)  # image_group[5]
 
         self.max_label = Label(font_0, text="max", color=Colors.RED)
         self.max_label.anchor_point = (1, 0)
         self.max_label.anchored_position = (self.width - 5, 90)
-        self.image_group.append(self.max_label)  # image_group[229]
+        self.image_group.append(self.max_label)  # image_group[6]
 
         self.avg_value = Label(font_0, text="---", color=Colors.YELLOW)
         self.avg_value.anchor_point = (1, 0)
         self.avg_value.anchored_position = (self.width - 5, 125)
-        self.image_group.append(self.avg_value)  # image_group[230]
+        self.image_group.append(self.avg_value)  # image_group[7]
 
         self.avg_label = Label(font_0, text="avg", color=Colors.YELLOW)
         self.avg_label.anchor_point = (1, 0)
         self.avg_label.anchored_position = (self.width - 5, 150)
-        self.image_group.append(self.avg_label)  # image_group[231]
+        self.image_group.append(self.avg_label)  # image_group[8]
 
         self.min_label = Label(font_0, text="min", color=Colors.CYAN)
         self.min_label.anchor_point = (1, 0)
         self.min_label.anchored_position = (self.width - 5, 210)
-        self.image_group.append(self.min_label)  # image_group[232]
+        self.image_group.append(self.min_label)  # image_group[9]
 
         self.min_value = Label(font_0, text="---", color=Colors.CYAN)
         self.min_value.anchor_point = (1, 0)
         self.min_value.anchored_position = (self.width - 5, 185)
-        self.image_group.append(self.min_value)  # image_group[233]
+        self.image_group.append(self.min_value)  # image_group[10]
 
         # Set backlight to brightness after initialization
         self._backlite.duty_cycle = int(self._brightness * 0xFFFF)
@@ -215,28 +286,56 @@ class Display:
 
     def alert(self, text=""):
         """Display alert message in status area. Default is a blank message.
+        The message flashes without blocking; call tick_alert once per frame.
         :param str text: The text to display. No default."""
         msg_text = text[:20]
         if msg_text == "" or msg_text is None:
             msg_text = ""
             self.status_label.text = msg_text
+            self._alert_start = None
         else:
             print("ALERT: " + msg_text)  # Print alert text in the REPL
             self.status_label.color = Colors.RED
             self.status_label.text = msg_text
-            time.sleep(0.1)
-            self.status_label.color = Colors.YELLOW
-            time.sleep(0.1)
-            self.status_label.color = Colors.RED
-            time.sleep(0.1)
-            self.status_label.color = Colors.YELLOW
-            time.sleep(0.5)
-            self.status_label.color = None
+            self._alert_color = Colors.RED
+            self._alert_start = time.monotonic()
+
+    def tick_alert(self):
+        """Advance the flashing alert message color. Hides the message after
+        the last flash phase. A non-blocking method."""
+        if self._alert_start is None:
+            return
+        elapsed = time.monotonic() - self._alert_start
+        for phase_end, phase_color in self.ALERT_PHASES:
+            if elapsed < phase_end:
+                color = phase_color
+                break
+        else:
+            color = None
+            self._alert_start = None
+        if color != self._alert_color:
+            self.status_label.color = color
+            self._alert_color = color
+
+    @property
+    def alert_active(self):
+        """True while an alert message is flashing."""
+        return self._alert_start is not None
 
     @property
     def grid_axis(self):
         return self._grid_axis
 
+    @property
+    def bmp_file_size(self):
+        """The size in bytes of the grid bitmap image file."""
+        return self._bmp_file_size
+
+    @property
+    def bmp_header(self):
+        """The 54-byte BMP and DIB header of the grid bitmap image file."""
+        return self._bmp_header
+
     def update_image_frame(self, grid_data, selfie=False):
         """Get normalized camera data and update the display.
         :param np.array grid_data: Two-dimensional list of grid values. No
@@ -244,48 +343,50 @@ class Display:
         :param bool selfie: The camera is forward-facing. Defaults to False
           (selfie disabled)."""
 
-        for _col in range(self._grid_axis[0]):
-            for _row in range(self._grid_axis[1]):
-                if selfie:
-                    color_index = grid_data[_col][self._grid_axis[1] - 1 - _row]
-                else:
-                    color_index = grid_data[_col][_row]
-                color = index_to_rgb(
-                    round(color_index * self._palette_size, 0) / self._palette_size
-                )
-                group_index = (_col * self._grid_axis[1]) + _row
-                if color != self.image_group[group_index].fill:
-                    self.image_group[group_index].fill = color
+        # Copy the grid into a flat array; flip columns for selfie view
+        if selfie:
+            grid_data = grid_data[:, ::-1]
+        q = grid_data.flatten()
+
+        # Quantize in place to palette indices; round half up when truncated
+        q *= self._palette_size
+        q += 0.5
+        q = np.array(q, dtype=self._index_dtype)
+
+        bitmaptools.arrayblit(self._bitmap, q)  # Copy indices into the grid bitmap
 
     def update_histo_frame(self, grid_data):
         """Display a histogram from a grid data array.
         :param np.array grid_data: Two-dimensional list of grid values.
           No default."""
+        histo_top = self._grid_axis[0] - 1
+        histo_rows = self._grid_axis[1]
 
-        histogram = np.zeros(self._grid_axis[0])  # Clear histogram accumulation array
         # Collect grid data and calculate the histogram
-        for _row in range(0, self._grid_axis[1]):
-            for _col in range(0, self._grid_axis[0]):
-                histo_index = int(
-                    map_range(grid_data[_col, _row], 0, 1, 0, self._grid_axis[0] - 1)
-                )
-                histogram[histo_index] = histogram[histo_index] + 1
-
-        histo_scale = np.max(histogram) / (self._grid_axis[0] - 1)
+        histo_index = np.array(
+            np.clip(grid_data.flatten() * histo_top, 0, histo_top), dtype=np.int16
+        )
+        histogram = [0] * self._grid_axis[0]  # Clear histogram accumulation list
+        for i in histo_index:
+            histogram[i] += 1
+
+        histo_scale = max(histogram) / histo_top
         if histo_scale <= 0:
             histo_scale = 1
 
-        # Display the histogram
+        # Display the histogram; column bars over a black background
+        q = np.full(
+            (histo_rows, self._grid_axis[0]), self._histo_black, dtype=self._index_dtype
+        )
         for _col in range(self._grid_axis[0]):
-            for _row in range(self._grid_axis[1]):
-                if histogram[_col] / histo_scale > self._grid_axis[0] - 1 - _row:
-                    self.image_group[
-                        ((_row * self._grid_axis[1]) + _col)
-                    ].fill = index_to_rgb(round((_col / self._grid_axis[1]), 3))
-                else:
-                    self.image_group[
-                        ((_row * self._grid_axis[1]) + _col)
-                    ].fill = Colors.BLACK
+            # Number of cells where histogram[_col] / histo_scale > histo_top - _row
+            height = histo_rows - 1 - math.floor(
+                histo_top - histogram[_col] / histo_scale
+            )
+            height = min(max(height, 0), histo_rows)
+            if height > 0:
+                q[histo_rows - height :, _col] = self._histo_base + _col
+        bitmaptools.arrayblit(self._bitmap, q)  # Copy indices into the grid bitmap
 
     def bytes_per_row(self, source_width):
         """Calculate bytes per row of the pixel source.
@@ -302,24 +403,18 @@ class Display:
         _blu = (rgb_color >> 0) & 0xFF
         return _blu, _grn, _red
 
-    def fetch_grid_row_bgr_colors(self, row, selfie=False):
-        """Fetches a row of RGB colors from the image_group and returns a list of GBR
-        values to be used to create a bitmap image. Reverses selfie image if needed.
+    def fetch_grid_row_bgr_colors(self, row, out, offset, selfie=False):
+        """Fetches a row of grid palette indices and writes the BGR color
+        values into a bitmap image buffer. Reverses selfie image if needed.
         :param int row: The row address. No default.
+        :param memoryview out: The bitmap image buffer. No default.
+        :param int offset: The buffer index of the first byte of the row. No default.
         :param bool selfie: The camera is forward-facing. Defaults to False
           (selfie disabled)."""
-        _row_buffer = np.zeros(self.bytes_per_row(self._grid_axis[0]), dtype=np.uint8)
-        _buffer_index = 0
-        if selfie:
-            row_range = range(self._grid_axis[0] - 1, -1, -1)
-        else:
-            row_range = range(0, self._grid_axis[0])
+        row_range = self._row_range_rev if selfie else self._row_range_fwd
+        row_start = row * self._grid_axis[0]
+        bitmap = self._bitmap
+        bgr_palette = self._bgr_palette
         for _col in row_range:
-            _rgb_color = self.image_group[((row * self._grid_axis[1]) + _col)].fill
-            (
-                _row_buffer[_buffer_index],
-                _row_buffer[_buffer_index + 1],
-                _row_buffer[_buffer_index + 2],
-            ) = self.rgb888_to_bgr888_tuple(_rgb_color)
-            _buffer_index += 3
-        return _row_buffer
+            out[offset : offset + 3] = bgr_palette[bitmap[row_start + _col]]
+            offset += 3
@@ -9,103 +9,59 @@ import board
 import busio
 from ulab import numpy as np
 import adafruit_mlx90640
+from camera_base import CameraBase
 
 
-class CameraMLX90640:
-    def __init__(self, temp_range_c=(-40, 300), auto_focus=True):
+class CameraMLX90640(CameraBase):
+    def __init__(self, temp_range_c=(-40, 300), auto_focus=True, i2c_frequency=1_000_000):
         """Initialize the CameraAMG88xx object.
         :param tuple temp_range_c: The camera's temperature range in Celsius.
           Defaults to the MLX90640 specification of -40 to 300 degrees Celsius.
         :param bool auto_focus: The autofocus enable state.
-          Defaults to True (enabled)."""
-        self._range_min_c = temp_range_c[0]
-        self._range_max_c = temp_range_c[1]
-        self._auto_focus = auto_focus
-
-        self._sensor_axis = [32, 24]  # The size of the sensor element array axis (32x24)
-        self._grid_axis = self._sensor_axis  # No interpolation for this camerra
+          Defaults to True (enabled).
+        :param int i2c_frequency: The I2C bus clock frequency in Hz. Falls back
+          to 800kHz if the board rejects the requested frequency.
+          Defaults to 1MHz (fast-mode plus)."""
+        # The size of the sensor element array axis (32x24); No interpolation for this camerra
+        super().__init__(temp_range_c, auto_focus, [32, 24])
 
         # Initiate the MLX90640 Thermal Camera
-        i2c = busio.I2C(board.SCL, board.SDA, frequency=800_000)  # orig 800_000
+        try:
+            i2c = busio.I2C(board.SCL, board.SDA, frequency=i2c_frequency)
+        except ValueError:
+            i2c = busio.I2C(board.SCL, board.SDA, frequency=800_000)
         self._mlx90640 = adafruit_mlx90640.MLX90640(i2c)
         self._mlx90640.refresh_rate = adafruit_mlx90640.RefreshRate.REFRESH_2_HZ  # 0.5 to 64Hz available
 
-        # Set up the 2-D sensor data narray
-        self._sensor_data = np.array(range(self._sensor_axis[0] * self._sensor_axis[1])).reshape((self._sensor_axis[0], self._sensor_axis[1]))
-
-        # Load the 2-D display color index narray with a spectrum
-        self._grid_data = np.array(range(self._grid_axis[0] * self._grid_axis[1])).reshape((self._grid_axis[0], self._grid_axis[1])) / (self._grid_axis[0] * self._grid_axis[1])
-        self._grid_data = self._grid_data[::-1, ::-1]
-
-        self._sensor_min_c = 0
-        self._sensor_avg_c = 0
-        self._sensor_max_c = 0
-
-    @property
-    def autofocus(self):
-        """The autofocus mode."""
-        return self._auto_focus
-
-    @autofocus.setter
-    def autofocus(self, new_focus):
-        """Enable or disable the autofocus mode.
-        :param bool new_focus: The autofocus enable state. No default."""
-        self._auto_focus = new_focus
-
-    @property
-    def statistics(self):
-        """Calculate the minimum, average, and maximum sensor
-        values of the latest camera acquisition."""
-        return self._sensor_min_c, self._sensor_avg_c, self._sensor_max_c
-
-    @property
-    def sensor_axis(self):
-        """The sensor axis sizes. Returns a tuple of the x-axis and
-        y-axis sizes."""
-        return self._sensor_axis
+        # Set up the sensor frame buffer (768 values)
+        self._frame_buf = np.zeros(self._sensor_axis[0] * self._sensor_axis[1], dtype=np.float)
 
-    @property
-    def grid_axis(self):
-        """Resultant grid axis sizes. Returns a tuple of the x-axis and
-        y-axis sizes."""
-        return self._grid_axis
-
-    @property
-    def grid_data(self):
-        """An two-dimensional np.array containing grid data."""
-        return self._grid_data
+        # Load the 2-D display color index narray with a descending spectrum
+        grid_cells = self._grid_axis[0] * self._grid_axis[1]
+        self._grid_data = np.arange(grid_cells - 1, -1, -1, dtype=np.float).reshape((self._grid_axis[0], self._grid_axis[1])) * (1 / grid_cells)
 
     def acquire(self):
         """Read the camera and return an array of interpolated and normalized
         grid values."""
-        #sensor = [0] * 768  # Prepare an empty sensor frame buffer list
-        sensor = np.array(range(self._sensor_axis[0] * self._sensor_axis[1]))
-        success = False
-        while not success:
-            self._mlx90640.getFrame(sensor)
-            success = True
-
-        sensor = sensor.reshape((self._sensor_axis[0], self._sensor_axis[1]))
-
-        # Put sensor data into an array; limit value to the sensor's range
-        self._sensor_data = np.clip(
-            np.array(sensor[::-1]), self._range_min_c, self._range_max_c
-        )
-
-        self._sensor_data = self._sensor_data[::-1, ::-1]  # Flip vertical
-
-        # Calculate statistics
-        self._sensor_min_c = np.min(self._sensor_data)
-        self._sensor_avg_c = np.mean(self._sensor_data)
-        self._sensor_max_c = np.max(self._sensor_data)
-
-        # Autofocus normalization
-        if self._auto_focus:
-            self._sensor_data = (self._sensor_data - self._sensor_min_c) / (
-                self._sensor_max_c - self._sensor_min_c
-            )
+        frame_buf = self._frame_buf
+        axis = self._sensor_axis
+
+        # Read the frame; retry once, then reuse the previous frame on failure.
+        #   The previous result stays valid because _finalize normalizes the
+        #   separate sensor data array in place, not the frame buffer; the
+        #   statistics also keep the previous frame's values
+        for _ in range(2):
+            try:
+                self._mlx90640.getFrame(frame_buf)
+                break
+            except (ValueError, OSError, RuntimeError):
+                continue
         else:
-            self._sensor_data = (self._sensor_data - self._range_min_c) / (
-                self._range_max_c - self._range_min_c
-            )
-        return self._sensor_data
+            return self._last_frame
+
+        # Limit values to the sensor's range in place in the frame buffer, then
+        #   copy it flipped along the second axis into the sensor data array
+        frame_buf[frame_buf < self._range_min_c] = self._range_min_c
+        frame_buf[frame_buf > self._range_max_c] = self._range_max_c
+        self._sensor_data[:, :] = frame_buf.reshape((axis[0], axis[1]))[:, ::-1]
+        return self._finalize(self._sensor_data)